@@ -0,0 +1,65 @@
+// Clientside callbacks for the SpaceX dashboard (registered in spacex-dash-app.py).
+// The pie is built from the precomputed `pie-data` store, so dropdown changes
+// never hit the server.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    viz: {
+        // PIE CHART: successes per site for 'ALL', success vs failure for one site
+        updatePie: function (site, pieData) {
+            var all = site === 'ALL';
+            var slices, colors, hole, title;
+            if (all) {
+                slices = pieData.all;
+                colors = pieData.all_colors;
+                hole = 0.35;
+                title = 'Successful Launches by Site (All Sites)';
+            } else {
+                // Cleared/unknown dropdown value renders an empty pie
+                slices = pieData.sites[site] || {labels: [], values: []};
+                colors = slices.labels.map(function (label) {
+                    return pieData.outcome_colors[label];
+                });
+                hole = 0.4;
+                title = 'Success vs Failure — ' + site;
+            }
+
+            var layout = JSON.parse(JSON.stringify(pieData.layout));
+            layout.title.text = title;
+
+            return {
+                data: [{
+                    type: 'pie',
+                    labels: slices.labels,
+                    values: slices.values,
+                    hole: hole,
+                    textposition: 'inside',
+                    textinfo: 'percent+label',
+                    marker: {colors: colors, line: {color: 'rgba(0,0,0,0.4)', width: 1}}
+                }],
+                layout: layout
+            };
+        },
+
+        // Sets `data: true` on the store `storeId` the first time the element `id`
+        // enters the viewport, so server callbacks gated on it only run for content
+        // the user actually sees. Returns immediately: nothing stays pending (and the
+        // page isn't shown as "Updating...") while waiting for the user to scroll.
+        whenVisible: function (id, storeId) {
+            var markVisible = function () {
+                window.dash_clientside.set_props(storeId, {data: true});
+            };
+            var el = document.getElementById(id);
+            if (!el || !('IntersectionObserver' in window)) {
+                markVisible();
+                return window.dash_clientside.no_update;
+            }
+            var observer = new IntersectionObserver(function (entries) {
+                if (entries.some(function (entry) { return entry.isIntersecting; })) {
+                    observer.disconnect();
+                    markVisible();
+                }
+            });
+            observer.observe(el);
+            return window.dash_clientside.no_update;
+        }
+    }
+});
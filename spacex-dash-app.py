@@ -7,28 +7,75 @@
 # - All callbacks preserved (pie responds to site; scatter responds to site + payload)
 # ---------------------------------------------------------------------
 
+import os
+import numpy as np
 import pandas as pd
 import dash
-from dash import html, dcc, callback
-from dash.dependencies import Input, Output
+import diskcache
+from dash import html, dcc, callback, DiskcacheManager
+from dash.dependencies import Input, Output, State, ClientsideFunction
+from dash.exceptions import PreventUpdate
+from flask_caching import Cache
+from flask_compress import Compress
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly_resampler import FigureResampler
 
 # -------------------------------
 # Load data + compute payload bounds
 # -------------------------------
-spacex_df = pd.read_csv("spacex_launch_dash.csv")
+# Prefer the binary Parquet copy (no text parsing/dtype inference at boot), falling back
+# to the CSV. Create it once with:
+#   pd.read_csv("spacex_launch_dash.csv").astype(
+#       {"Launch Site": "category", "Booster Version Category": "category"}).to_parquet("spacex.parquet")
+try:
+    spacex_df = pd.read_parquet("spacex.parquet")
+except FileNotFoundError:
+    # pyarrow's multithreaded CSV reader; columns still land as NumPy dtypes below
+    spacex_df = pd.read_csv("spacex_launch_dash.csv", engine='pyarrow')
+
+# Compact dtypes (no-ops for columns the Parquet file already stores this way):
+# site/booster groupbys work on integer category codes. Payload stays float64 so
+# hover/zoom values are exact (float32 would show e.g. 2485.60009765625)
+for col in ('Launch Site', 'Booster Version Category'):
+    spacex_df[col] = spacex_df[col].astype('category')
+spacex_df['class'] = spacex_df['class'].astype('int8')
+spacex_df['Payload Mass (kg)'] = spacex_df['Payload Mass (kg)'].astype('float64')
+
+# Keep rows sorted by payload so a slider range maps to one contiguous slice
+spacex_df = spacex_df.sort_values('Payload Mass (kg)').reset_index(drop=True)
+PAYLOADS = spacex_df['Payload Mass (kg)'].to_numpy()
+
+# Row positions (ascending, in payload order) for each launch site
+SITE_INDEX = {site: np.asarray(idx) for site, idx in
+              spacex_df.groupby('Launch Site', observed=True).indices.items()}
+NO_ROWS = np.array([], dtype=np.intp)
 max_payload = int(spacex_df['Payload Mass (kg)'].max())
 min_payload = int(spacex_df['Payload Mass (kg)'].min())
 
-# Clamp nice marks for slider (every ~1200 or dynamic)
-step = 1200
-marks = {i: str(i) for i in range(0, max_payload + step, step)}
-
-# Accent colors
-NEON_BLUE = "#ffffff"
+# -------------------------------
+# Precomputed pie aggregates (built once at load, rendered clientside)
+# -------------------------------
+# 'ALL' view: successful launches (class==1) per Launch Site
+ALL_SUCCESS_BY_SITE = (spacex_df.loc[spacex_df['class'] == 1]
+                       .groupby('Launch Site', as_index=False, observed=True).size()
+                       .rename(columns={'size': 'success_count'}))
+
+# Per-site view: success vs failure counts, with readable outcome labels
+PER_SITE_OUTCOME = {
+    site: (g.groupby('class', as_index=False).size().rename(columns={'size': 'count'})
+           .assign(outcome=lambda d: d['class'].map({1: 'Success', 0: 'Failure'})))
+    for site, g in spacex_df.groupby('Launch Site', observed=True)
+}
+
+# A fixed handful of evenly spaced slider marks over the slider's span (fewer DOM nodes)
+slider_max = max(10000, max_payload)
+SLIDER_TICK_COUNT = 6  # 0, 2,000, ..., 10,000 for the default span
+marks = {int(t): f'{int(t):,}' for t in np.linspace(0, slider_max, SLIDER_TICK_COUNT, dtype=int)}
+
+# Colors used by figures and inline styles (page theme colors live in assets/theme.css)
 DEEP_BG = "#06070a"        # main page background
 CARD_BG = "#0b1220"        # card background
-CARD_BORDER = "#0f2940"    # subtle border
 TEXT_COLOR = "#dbeefd"     # readable off-white
 SUBTEXT = "#ffffff"
 
@@ -39,177 +86,126 @@ external_stylesheets = [
     # No CSS frameworks required; we load Google Fonts via index_string below
 ]
 
-app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+# Background callbacks run out-of-process, so slow scatter renders don't block a worker
+background_callback_manager = DiskcacheManager(diskcache.Cache("./dash-cache"))
+
+app = dash.Dash(__name__, external_stylesheets=external_stylesheets,
+                background_callback_manager=background_callback_manager)
 server = app.server  # expose for deployment if needed
 
-# We'll insert a small block of CSS & fonts in the page via a <style> element
-page_css = f"""
-/* Google font loaded in head (see app.index_string below) */
-:root {{
-  --neon: {NEON_BLUE};
-  --bg: {DEEP_BG};
-  --card: {CARD_BG};
-  --card-border: {CARD_BORDER};
-  --text: {TEXT_COLOR};
-  --subtext: {SUBTEXT};
-}}
-
-html, body, #root {{
-  height: 100%;
-  margin: 0;
-  background: linear-gradient(180deg, #03040a 0%, #071022 100%);
-  font-family: "Poppins", "Inter", "Roboto Condensed", sans-serif;
-  color: var(--text);
-}}
-
-/* Layout */
-.container {{
-  max-width: 1200px;
-  margin: 28px auto;
-  padding: 20px;
-}}
-
-/* Card style */
-.card {{
-  background: var(--card);
-  border-radius: 12px;
-  padding: 18px;
-  margin-bottom: 18px;
-  box-shadow: 0 6px 18px rgba(2,8,18,0.8), inset 0 1px 0 rgba(255,255,255,0.02);
-  border: 1px solid rgba(255,255,255,0.03);
-}}
-
-.controls {{
-  display: flex;
-  gap: 16px;
-  align-items: center;
-  flex-wrap: wrap;
-}}
-
-/* Dropdown, slider containers */
-.control-item {{
-  min-width: 220px;
-  flex: 1 1 260px;
-}}
-
-/* Title gradient + subtle animation */
-.gradient-title {{
-  font-size: 34px;
-  font-weight: 700;
-  text-align: center;
-  margin-bottom: 10px;
-  background: linear-gradient(90deg, #00bfff, #ffffff, #10e8ff);
-  -webkit-background-clip: text;
-  background-clip: text;
-  color: transparent;
-  animation: titleShift 6s linear infinite;
-  display: inline-block;
-  letter-spacing: -0.5px;
-}}
-@keyframes titleShift {{
-  0% {{ background-position: 0% 50%; }}
-  50% {{ background-position: 100% 50%; }}
-  100% {{ background-position: 0% 50%; }}
-}}
-
-/* Subtitle */
-.title-sub {{
-  text-align: center;
-  color: var(--subtext);
-  margin-bottom: 20px;
-}}
-
-/* Explanatory text under charts */
-.chart-desc {{
-  font-size: 13px;
-  color: var(--subtext);
-  margin-top: 8px;
-  margin-bottom: 12px;
-}}
-
-/* Footer */
-.footer {{
-  text-align: center;
-  color: var(--subtext);
-  padding: 12px 0;
-  font-size: 13px;
-  margin-top: 20px;
-}}
-
-/* Neon focus / hover for interactive elements */
-:focus, :hover {{
-  outline: none;
-}}
-.dcc-dropdown .Select-control, .dash-dropdown {{
-  border-radius: 8px;
-  color: white;
-}}
-.dash-graph .js-plotly-plot .plotly .main-svg {{
-  transition: all 0.25s ease;
-}}
-
-/* Make slider handles glow */
-.rc-slider-handle, .dash-range-slider .rc-slider-handle {{
-  box-shadow: 0 0 8px rgba(0,229,255,0.9);
-  border: 2px solid rgba(0,229,255,0.9) !important;
-}}
-/* --- Fix dropdown visibility --- */
-.Select-menu-outer, .Select-menu {{
-  background-color: #0b1220 !important;  /* dark dropdown background */
-  color: #ffffff !important;             /* white text */
-  border: 1px solid #0f2940 !important;
-  box-shadow: 0 0 12px rgba(0, 200, 255, 0.3);
-}}
-
-.Select-option {{
-  background-color: #0b1220 !important;
-  color: #ffffff !important;
-}}
-
-.Select-option:hover,
-.Select-option.is-focused,
-.Select-option.is-selected {{
-  background-color: #102a44 !important; /* glowing blue-ish highlight */
-  color: #00e0ff !important;
-}}
-
-.Select-control,
-.Select-value-label,
-.Select--single > .Select-control .Select-value,
-.Select-placeholder {{
-  background-color: #0b1220 !important;
-  color: #ffffff !important;
-}}
-
-/* small responsive tweaks */
-@media (max-width: 820px) {{
-  .controls {{ flex-direction: column; align-items: stretch; }}
-}}
-"""
+# Compress responses (figure JSON repeats field names and compresses well)
+app.server.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.server.config['COMPRESS_LEVEL'] = 6
+Compress(app.server)
+
+# On-disk figure cache: repeated dropdown/slider states skip figure rebuilds. File-backed
+# (not in-memory) so background-callback processes and the zoom callback share entries
+cache = Cache(app.server, config={'CACHE_TYPE': 'FileSystemCache', 'CACHE_DIR': './dash-cache/figures',
+                                  'CACHE_DEFAULT_TIMEOUT': 300})
+
+# Payload slider step (kg)
+PAYLOAD_STEP = 100
+
+# Max points per scatter trace sent to the browser; larger traces are downsampled
+# server-side and re-sampled on zoom
+SCATTER_MAX_POINTS = 2000
 
 # Insert Google Fonts and page meta into index_string for Poppins
-app.index_string = f"""
+app.index_string = """
 <!DOCTYPE html>
 <html>
     <head>
-        {{%metas%}}
+        {%metas%}
         <title>SpaceX — Black-is-Blue Dashboard</title>
         <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap" rel="stylesheet">
-        {{%favicon%}}
-        {{%css%}}
-        <style>{page_css}</style>
+        {%favicon%}
+        {%css%}
     </head>
     <body>
-        {{%app_entry%}}
+        {%app_entry%}
         <footer>
-            {{%config%}}
-            {{%scripts%}}
-            {{%renderer%}}
+            {%config%}
+            {%scripts%}
+            {%renderer%}
         </footer>
     </body>
 </html>
 """
 
+# -------------------------------
+# Helper: common plot styling for Plotly figures
+# -------------------------------
+# Static pieces of the dark theme, built once and splatted into every figure
+DARK_LAYOUT_BASE = dict(
+    template='plotly_dark',
+    paper_bgcolor=DEEP_BG,
+    plot_bgcolor=CARD_BG,
+    font=dict(color=TEXT_COLOR, family="Poppins, sans-serif"),
+    margin=dict(l=40, r=24, t=60, b=40),
+    legend=dict(bgcolor='rgba(0,0,0,0)', bordercolor='rgba(255,255,255,0.04)'),
+    hoverlabel=dict(bgcolor="rgba(2,8,20,0.95)", font_size=12, font_family="Poppins")
+)
+DARK_TITLE_POSITION = dict(x=0.02, xanchor='left', y=0.98, yanchor='top', font=dict(size=16))
+# Plot area grid subtle
+DARK_AXES = dict(showgrid=True, gridcolor='rgba(255,255,255,0.03)', zerolinecolor='rgba(255,255,255,0.05)')
+
+def apply_dark_style(fig, title_text=None):
+    """Apply cohesive dark theme and neon blue accents to Plotly figure."""
+    # Use plotly_dark as base then override colors
+    fig.update_layout(
+        **DARK_LAYOUT_BASE,
+        title=dict(DARK_TITLE_POSITION,
+                   text=title_text or fig.layout.title.text if fig.layout.title else None)
+    )
+    fig.update_xaxes(**DARK_AXES)
+    fig.update_yaxes(**DARK_AXES)
+
+    # Try to tint traces with neon if discrete colors are present
+    return fig
+
+# -------------------------------
+# Pie chart data for the clientside renderer (assets/viz.js)
+# -------------------------------
+# The pie only depends on the dropdown, so it is drawn in the browser from this
+# payload (shipped once with the layout) with no server round-trip per selection.
+# plotly.js can't resolve template names, so the client layout omits 'template';
+# every colour the pie uses is set explicitly instead.
+PIE_DATA = {
+    'all': {'labels': ALL_SUCCESS_BY_SITE['Launch Site'].tolist(),
+            'values': ALL_SUCCESS_BY_SITE['success_count'].tolist()},
+    'sites': {site: {'labels': df['outcome'].tolist(), 'values': df['count'].tolist()}
+              for site, df in PER_SITE_OUTCOME.items()},
+    'all_colors': px.colors.sequential.Blues,
+    'outcome_colors': {'Failure': "#00E5FF", 'Success': "#16324a"},
+    'layout': go.Layout({k: v for k, v in DARK_LAYOUT_BASE.items() if k != 'template'},
+                        title=DARK_TITLE_POSITION).to_plotly_json(),
+}
+
+# -------------------------------
+# Scatter figure templates (styled once per site, copied per callback)
+# -------------------------------
+def build_scatter_template(entered_site):
+    """Empty scatter figure with the full dark styling, axes and separator line applied."""
+    fig = go.Figure(layout=dict(height=520, xaxis_title="Payload Mass (kg)",
+                                legend_title_text="Booster Version Category, class"))
+    # Y-axis: treat class as categorical-like but keep numeric ticks 0/1
+    fig.update_yaxes(dtick=1, tickmode='linear', tick0=0, title_text="Mission Outcome (0 = Failure, 1 = Success)")
+
+    fig = apply_dark_style(fig, title_text=("Payload vs Mission Outcome" + (f" — {entered_site}" if entered_site != 'ALL' else "")))
+
+    # Add subtle horizontal lines for success / failure separation
+    fig.add_hline(y=0.5, line_dash="dash", line_color="rgba(255,255,255,0.06)")
+    return fig
+
+SCATTER_TEMPLATES = {site: build_scatter_template(site) for site in ['ALL', *SITE_INDEX]}
+
+# Fixed per-trace styling: one colour per booster category, one symbol per outcome
+SCATTER_PALETTE = px.colors.qualitative.Plotly
+CATEGORY_COLORS = {cat: SCATTER_PALETTE[i % len(SCATTER_PALETTE)]
+                   for i, cat in enumerate(spacex_df['Booster Version Category'].cat.categories)}
+OUTCOME_SYMBOLS = {0: 'circle', 1: 'diamond'}
+SCATTER_MARKER_LINE = dict(width=0.6, color='rgba(0,0,0,0.4)')
+
 # -------------------------------
 # Layout
 # -------------------------------
@@ -253,10 +249,11 @@ app.layout = html.Div(className="container", children=[
                 dcc.RangeSlider(
                     id='slider-payload',
                     min=0,
-                    max=max(10000, max_payload),
-                    step=100,
+                    max=slider_max,
+                    step=PAYLOAD_STEP,
                     marks=marks,
                     value=[min_payload, max_payload],
+                    updatemode='mouseup',  # fire callbacks on release, not on every drag step
                     tooltip={"placement": "bottom", "always_visible": False}
                 )
             ]),
@@ -265,6 +262,12 @@ app.layout = html.Div(className="container", children=[
                  children="Tip: use the dropdown to focus on a site, and the slider to zoom into payload ranges.")
     ], style = {"color": "white"}),
 
+    # Precomputed pie data for the clientside pie renderer
+    dcc.Store(id='pie-data', data=PIE_DATA),
+
+    # Shared (site, payload range) row selection, computed once per input change
+    dcc.Store(id='filtered-idx'),
+
     # Pie chart card
     html.Div(className="card", children=[
         html.Div(dcc.Graph(id='success-pie-chart', config={"displayModeBar": False}), className="dash-graph"),
@@ -273,7 +276,11 @@ app.layout = html.Div(className="container", children=[
 
     # Scatter card
     html.Div(className="card", children=[
-        html.Div(dcc.Graph(id='success-payload-scatter-chart', config={"displayModeBar": False}), className="dash-graph"),
+        # Reserved-height slot; its figure is only requested once the slot scrolls into view
+        html.Div(id='scatter-slot', style={'minHeight': '520px'}, children=[
+            html.Div(dcc.Graph(id='success-payload-scatter-chart', config={"displayModeBar": False}), className="dash-graph"),
+        ]),
+        dcc.Store(id='scatter-visible', data=False),
         html.Div("Scatter plot showing relationship between payload mass and mission outcome (1 = success). Color = Booster Version Category.", className="chart-desc")
     ]),
 
@@ -285,118 +292,127 @@ app.layout = html.Div(className="container", children=[
 ])
 
 # -------------------------------
-# Helper: common plot styling for Plotly figures
+# Callbacks
 # -------------------------------
-def apply_dark_style(fig, title_text=None):
-    """Apply cohesive dark theme and neon blue accents to Plotly figure."""
-    # Use plotly_dark as base then override colors
-    fig.update_layout(
-        template='plotly_dark',
-        paper_bgcolor=DEEP_BG,
-        plot_bgcolor=CARD_BG,
-        font=dict(color=TEXT_COLOR, family="Poppins, sans-serif"),
-        title=dict(text=title_text or fig.layout.title.text if fig.layout.title else None,
-                   x=0.02, xanchor='left', y=0.98, yanchor='top', font=dict(size=16)),
-        margin=dict(l=40, r=24, t=60, b=40),
-        legend=dict(bgcolor='rgba(0,0,0,0)', bordercolor='rgba(255,255,255,0.04)'),
-        hoverlabel=dict(bgcolor="rgba(2,8,20,0.95)", font_size=12, font_family="Poppins")
-    )
-    # Plot area grid subtle
-    fig.update_xaxes(showgrid=True, gridcolor='rgba(255,255,255,0.03)', zerolinecolor='rgba(255,255,255,0.05)')
-    fig.update_yaxes(showgrid=True, gridcolor='rgba(255,255,255,0.03)', zerolinecolor='rgba(255,255,255,0.05)')
+# PIE CHART: rendered clientside by window.dash_clientside.viz.updatePie (assets/viz.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='updatePie'),
+    Output(component_id="success-pie-chart", component_property="figure"),
+    Input(component_id="site-dropdown", component_property="value"),
+    State(component_id="pie-data", component_property="data")
+)
 
-    # Try to tint traces with neon if discrete colors are present
-    return fig
+# SCATTER visibility: sets scatter-visible once the scatter slot first enters the viewport
+# (assets/viz.js); the store is written later via set_props, the callback itself returns at once
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='whenVisible'),
+    Output(component_id="scatter-visible", component_property="data"),
+    Input(component_id="scatter-slot", component_property="id"),
+    State(component_id="scatter-visible", component_property="id")
+)
 
-# -------------------------------
-# Callbacks
-# -------------------------------
-# PIE CHART callback: updates when a site is selected
+# FILTER callback: resolves site + payload range to rows once, shared via dcc.Store
 @callback(
-    Output(component_id="success-pie-chart", component_property="figure"),
-    Input(component_id="site-dropdown", component_property="value")
+    Output(component_id="filtered-idx", component_property="data"),
+    Input(component_id="site-dropdown", component_property="value"),
+    Input(component_id="slider-payload", component_property="value"),
+    Input(component_id="scatter-visible", component_property="data")
 )
-def update_pie(entered_site):
+def update_filter(entered_site, selected_payload, scatter_visible):
     """
-    If 'ALL' selected -> show successes per launch site.
-    If specific site selected -> show success vs failure counts for that site.
+    Store the selection as (site, lo, hi): rows [lo, hi) of the payload-sorted frame,
+    further restricted to the site's rows unless 'ALL' is selected.
+    Nothing is stored (so no scatter is built) until the scatter has been scrolled into view.
     """
-    if entered_site == 'ALL':
-        # Count successful launches (class==1) grouped by Launch Site
-        df = spacex_df[spacex_df['class'] == 1].groupby('Launch Site').size().reset_index(name='success_count')
-        fig = px.pie(df, values='success_count', names='Launch Site',
-                     title='Successful Launches by Site',
-                     color_discrete_sequence=px.colors.sequential.Blues)
-        fig.update_traces(textposition='inside', textinfo='percent+label', hole=0.35)
-        fig = apply_dark_style(fig, title_text="Successful Launches by Site (All Sites)")
-    else:
-        # For a single site show success vs failure counts
-        df = spacex_df[spacex_df['Launch Site'] == entered_site].groupby('class').size().reset_index(name='count')
-        # Map class 1/0 to labels
-        df['outcome'] = df['class'].map({1: 'Success', 0: 'Failure'})
-        fig = px.pie(df, values='count', names='outcome',
-                     title=f'Success vs Failure — {entered_site}',
-                     color_discrete_sequence=["#00E5FF", "#16324a"])
-        fig.update_traces(textposition='inside', textinfo='percent+label', hole=0.4)
-        fig = apply_dark_style(fig, title_text=f"Success vs Failure — {entered_site}")
-
-    # Slightly enlarge hover labels and add neon slice border
-    fig.update_traces(marker=dict(line=dict(color='rgba(0,0,0,0.4)', width=1)))
-    return fig
+    if not scatter_visible:
+        raise PreventUpdate
+    low, high = selected_payload
+    # Payload range -> contiguous slice of the payload-sorted frame (binary search, no mask)
+    lo_i = int(np.searchsorted(PAYLOADS, low, side='left'))
+    hi_i = int(np.searchsorted(PAYLOADS, high, side='right'))
+    return {'site': entered_site, 'lo': lo_i, 'hi': hi_i}
 
-# SCATTER callback: updates when site or payload range change
+# SCATTER callback: updates when the shared filter changes
 @callback(
     Output(component_id='success-payload-scatter-chart', component_property='figure'),
-    Input(component_id="site-dropdown", component_property="value"),
-    Input(component_id="slider-payload", component_property="value")
+    Input(component_id="filtered-idx", component_property="data"),
+    background=True,
+    # Poll for the finished job every 150 ms (default 1000 ms would dominate a ~45 ms render)
+    interval=150,
+    # Dim the chart while a render is in flight instead of freezing the UI
+    running=[(Output(component_id='success-payload-scatter-chart', component_property='style'),
+              {'opacity': 0.5}, {'opacity': 1})]
 )
-def update_scatter(entered_site, selected_payload):
+def update_scatter(filtered):
     """
     Scatter: payload vs class (mission outcome)
     Filters by selected site (if not 'ALL') and payload range.
     Color-coded by Booster Version Category.
     """
-    low, high = selected_payload
-    # Filter by payload range first
-    dff = spacex_df[(spacex_df['Payload Mass (kg)'] >= low) &
-                    (spacex_df['Payload Mass (kg)'] <= high)]
-
-    # If a specific site is selected, filter by it
-    if entered_site != 'ALL':
-        dff = dff[dff['Launch Site'] == entered_site]
-
-    # Build scatter
-    fig = px.scatter(
-        dff,
-        x="Payload Mass (kg)",
-        y="class",
-        color="Booster Version Category",
-        title="Payload vs Mission Outcome by Booster Version",
-
-        symbol="class",
-        height=520
-    )
-
-    # Tweak appearance: use blue-ish color palette when possible
-    # If many categories exist, let Plotly choose, otherwise force blue palette
-    try:
-        fig.update_traces(marker=dict(size=10, line=dict(width=0.6, color='rgba(0,0,0,0.4)')))
-    except Exception:
-        pass
-
-    # Y-axis: treat class as categorical-like but keep numeric ticks 0/1
-    fig.update_yaxes(dtick=1, tickmode='linear', tick0=0, title_text="Mission Outcome (0 = Failure, 1 = Success)")
+    # Nothing stored yet: the scatter hasn't been scrolled into view
+    if filtered is None:
+        raise PreventUpdate
+    return build_scatter_figure(filtered['site'], filtered['lo'], filtered['hi'])
 
-    fig = apply_dark_style(fig, title_text=("Payload vs Mission Outcome" + (f" — {entered_site}" if entered_site != 'ALL' else "")))
-
-    # Add subtle horizontal lines for success / failure separation
-    fig.add_hline(y=0.5, line_dash="dash", line_color="rgba(255,255,255,0.06)")
-
-    return fig
+# SCATTER zoom callback: re-samples the cached figure for the zoomed payload window
+@callback(
+    Output(component_id='success-payload-scatter-chart', component_property='figure', allow_duplicate=True),
+    Input(component_id='success-payload-scatter-chart', component_property='relayoutData'),
+    State(component_id="filtered-idx", component_property="data"),
+    prevent_initial_call=True
+)
+def resample_scatter(relayout_data, filtered):
+    """Send only the downsampled points for the new view (no-op when nothing was downsampled)."""
+    # Autosize/resize relayouts can arrive before the scatter has been built
+    if not filtered:
+        raise PreventUpdate
+    fig = build_scatter_figure(filtered['site'], filtered['lo'], filtered['hi'])
+    return fig.construct_update_data_patch(relayout_data)
+
+def filtered_rows(entered_site, lo_i, hi_i):
+    """Rows of spacex_df selected by a stored (site, lo, hi) filter."""
+    if entered_site == 'ALL':
+        return spacex_df.iloc[lo_i:hi_i]
+    # Site rows inside [lo_i, hi_i): both are sorted, so this is two more binary searches
+    site_rows = SITE_INDEX.get(entered_site, NO_ROWS)
+    return spacex_df.iloc[site_rows[np.searchsorted(site_rows, lo_i):np.searchsorted(site_rows, hi_i)]]
+
+@cache.memoize()
+def build_scatter_figure(entered_site, lo_i, hi_i):
+    """Build (or fetch from cache) the scatter figure for a stored (site, lo, hi) filter."""
+    dff = filtered_rows(entered_site, lo_i, hi_i)
+
+    # Copy the pre-styled template for this site, then add only the data traces
+    template = SCATTER_TEMPLATES.get(entered_site)
+    if template is None:
+        template = build_scatter_template(entered_site)
+    fig = go.Figure(template)
+    # One scattergl (WebGL) trace per (booster category, outcome), as px.scatter would emit
+    traces = [
+        go.Scattergl(
+            x=group['Payload Mass (kg)'].to_numpy(),
+            y=group['class'].to_numpy(),
+            mode='markers',
+            name=f"{category}, {outcome}",
+            legendgroup=f"{category}, {outcome}",
+            marker=dict(color=CATEGORY_COLORS[category], symbol=OUTCOME_SYMBOLS[outcome],
+                        size=10, line=SCATTER_MARKER_LINE),
+            hovertemplate=(f"Booster Version Category={category}<br>"
+                           "Payload Mass (kg)=%{x}<br>class=%{y}<extra></extra>")
+        )
+        for (category, outcome), group in dff.groupby(['Booster Version Category', 'class'], observed=True)
+    ]
+    fig.add_traces(traces)
+
+    # Wide payload ranges: ship at most SCATTER_MAX_POINTS per trace to the browser
+    return FigureResampler(fig, default_n_shown_samples=SCATTER_MAX_POINTS)
 
 # -------------------------------
 # Run server
 # -------------------------------
 if __name__ == '__main__':
-    # Debug True includes hot reload and helpful tracebacks during dev
-    app.run(debug=True, port=8050)
+    # Dev tools (hot reload, props checking, error UI) only with DASH_DEBUG=1;
+    # production boots without their per-request overhead and watcher thread
+    DEBUG = os.environ.get('DASH_DEBUG', '0') == '1'
+    app.run(debug=DEBUG, port=int(os.environ.get('PORT', '8050')),
+            dev_tools_hot_reload=DEBUG, dev_tools_props_check=DEBUG, dev_tools_ui=DEBUG)